@@ -4,9 +4,7 @@ Runs performance experiments for adding elements under the dynamic algorithms.
 """
 
 
-import copy
 import functools
-import random
 import typing as tp
 
 import numpy as np
@@ -25,7 +23,7 @@ from utils.performance_experiment import (
     PerformanceExperiment,
     PerformanceExperimentGroup,
 )
-from utils.seed import set_seed
+from utils.seed import set_seed, spawn_rng
 from utils.stopwatch import Stopwatch
 
 
@@ -33,15 +31,18 @@ set_seed(2022)
 
 
 def input_generator(size: int, rank: int) -> tp.Iterator[InputData]:
+    rng = spawn_rng()
     while True:
         # reuse same matroid for 10 instances
         matroid = generate_random_graphical_matroid(size, rank, uniform_weights=False)
-        missing_edges = list(compute_missing_edges(matroid.graph, extra_nodes={-1}))
-        for _ in range(10):
+        missing_edges = compute_missing_edges(matroid.graph, extra_nodes={-1})
+        edges = missing_edges[rng.integers(len(missing_edges), size=10)].tolist()
+        weights = rng.uniform(low=-1.0, high=1.0, size=10).tolist()
+        for edge, weight in zip(edges, weights):
             yield {
                 "matroid": matroid,
-                "element_to_add": random.choice(missing_edges),
-                "weight": np.random.uniform(low=-1.0, high=1.0),
+                "element_to_add": tuple(edge),
+                "weight": weight,
             }
 
 
@@ -53,7 +54,7 @@ def time_full_dynamic(
 ):
     """Time one run of the given dynamic algorithm; return time in seconds."""
     # make copy of shared matroid (because it's mutable)
-    matroid = copy.deepcopy(matroid)
+    matroid = matroid.clone()
     algorithm_instance = algorithm(matroid)
 
     with Stopwatch() as stopwatch:
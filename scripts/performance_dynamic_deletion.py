@@ -3,9 +3,7 @@
 Runs performance experiments for removing elements under the dynamic algorithms.
 """
 
-import copy
 import functools
-import random
 import typing as tp
 
 import numpy as np
@@ -15,6 +13,7 @@ from matroids.algorithms.dynamic import (
     NaiveDynamic,
     PartialDynamicMaximalIndependentSetAlgorithm,
     RestartGreedy,
+    dynamic_removal_maximal_independent_set,
     dynamic_removal_maximal_independent_set_uniform_weights,
 )
 from utils.generate import (
@@ -25,7 +24,7 @@ from utils.performance_experiment import (
     PerformanceExperiment,
     PerformanceExperimentGroup,
 )
-from utils.seed import set_seed
+from utils.seed import set_seed, spawn_rng
 from utils.stopwatch import Stopwatch
 
 
@@ -35,16 +34,17 @@ set_seed(2022)
 def input_generator(
     size: int, rank: int, uniform_weights: bool
 ) -> tp.Iterator[InputData]:
+    rng = spawn_rng()
     while True:
         # reuse same matroid for 10 instances
         matroid = generate_random_graphical_matroid(
             size, rank, uniform_weights=uniform_weights
         )
         elements = list(matroid.ground_set)
-        for _ in range(10):
+        for i in rng.choice(len(elements), size=10):
             yield {
                 "matroid": matroid,
-                "element_to_remove": random.choice(elements),
+                "element_to_remove": elements[i],
             }
 
 
@@ -55,7 +55,7 @@ def time_partial_dynamic(
 ) -> float:
     """Time one run of the given dynamic algorithm; return time in seconds."""
     # make copy of shared matroid (because it's mutable)
-    matroid = copy.deepcopy(matroid)
+    matroid = matroid.clone()
 
     # start generator (only want to time dynamic part)
     remover = algorithm(matroid)
@@ -74,7 +74,7 @@ def time_full_dynamic(
 ):
     """Time one run of the given dynamic algorithm; return time in seconds."""
     # make copy of shared matroid (because it's mutable)
-    matroid = copy.deepcopy(matroid)
+    matroid = matroid.clone()
     algorithm_instance = algorithm(matroid)
 
     with Stopwatch() as stopwatch:
@@ -86,6 +86,9 @@ def time_full_dynamic(
 non_uniform_timers = {
     "restart_greedy": functools.partial(time_full_dynamic, RestartGreedy),
     "naive_dynamic": functools.partial(time_full_dynamic, NaiveDynamic),
+    "removal_dynamic": functools.partial(
+        time_partial_dynamic, dynamic_removal_maximal_independent_set
+    ),
 }
 
 
@@ -3,9 +3,7 @@
 Runs performance experiments for performing an exhausting sequence of deletions.
 """
 
-import copy
 import functools
-import random
 import typing as tp
 
 import numpy as np
@@ -21,12 +19,13 @@ from matroids.matroid import MutableMatroid, T
 from utils.generate import (
     generate_random_graphical_matroid,
 )
+from utils.misc import consume
 from utils.performance_experiment import (
     InputData,
     PerformanceExperiment,
     PerformanceExperimentGroup,
 )
-from utils.seed import set_seed
+from utils.seed import set_seed, spawn_rng
 from utils.stopwatch import Stopwatch
 
 
@@ -34,13 +33,15 @@ set_seed(2022)
 
 
 def input_generator(size: int, rank: int) -> tp.Iterator[InputData]:
+    rng = spawn_rng()
     while True:
         # reuse same matroid for 3 instances
         matroid = generate_random_graphical_matroid(size, rank, uniform_weights=True)
         elements = list(matroid.ground_set)
         for _ in range(3):
-            random.shuffle(elements)
-            yield {"matroid": matroid, "removal_sequence": elements}
+            # a fresh random order each time (not a shared list shuffled in-place)
+            order = rng.permutation(len(elements))
+            yield {"matroid": matroid, "removal_sequence": [elements[i] for i in order]}
 
 
 def time_partial_dynamic(
@@ -50,15 +51,16 @@ def time_partial_dynamic(
 ) -> float:
     """Time one run of the given dynamic algorithm; return time in seconds."""
     # make copy of shared matroid (because it's mutable)
-    matroid = copy.deepcopy(matroid)
+    matroid = matroid.clone()
 
     # start generator (only want to time dynamic part)
     remover = algorithm(matroid)
     remover.send(None)
 
+    # bind the method beforehand so that only the algorithm itself is timed
+    remove = remover.send
     with Stopwatch() as stopwatch:
-        for element in removal_sequence:
-            remover.send(element)
+        consume(map(remove, removal_sequence))
 
     return stopwatch.measurement
 
@@ -70,12 +72,13 @@ def time_full_dynamic(
 ):
     """Time one run of the given dynamic algorithm; return time in seconds."""
     # make copy of shared matroid (because it's mutable)
-    matroid = copy.deepcopy(matroid)
+    matroid = matroid.clone()
     algorithm_instance = algorithm(matroid)
 
+    # bind the method beforehand so that only the algorithm itself is timed
+    remove = algorithm_instance.remove_element
     with Stopwatch() as stopwatch:
-        for element in removal_sequence:
-            algorithm_instance.remove_element(element)
+        consume(map(remove, removal_sequence))
 
     return stopwatch.measurement
 
@@ -91,7 +94,7 @@ timers = {
 # versions that divide total time by number of removals
 timers_per_removal = {
     label: lambda _timer=timer, **variables: (
-        _timer(**variables) / len(variables["matroid"].ground_set)
+        _timer(**variables) / len(variables["removal_sequence"])
     )
     for label, timer in timers.items()
 }
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """Empirical analysis of the dynamic algorithms on real graph datasets."""
 
-import copy
 import functools
 import itertools as itt
-import random
 import typing as tp
 
+import networkx as nx
+
 from matroids.algorithms.dynamic import (
     DynamicMaximalIndependentSetAlgorithm,
     NaiveDynamic,
@@ -15,12 +15,13 @@ from matroids.algorithms.dynamic import (
     dynamic_removal_maximal_independent_set_uniform_weights,
 )
 from matroids.matroid import GraphicalMatroid, MutableMatroid, T, set_weights
+from utils.misc import consume
 from utils.performance_experiment import (
     InputData,
     PerformanceExperiment,
     PerformanceExperimentGroup,
 )
-from utils.seed import set_seed
+from utils.seed import set_seed, spawn_rng
 from utils.slndc import load_facebook_dataset
 from utils.stopwatch import Stopwatch
 
@@ -29,31 +30,35 @@ set_seed(2022)
 
 
 # download a graph dataset from the Stanford Large Network Dataset Collection
-# index by number of edges (size of ground set)
+# index by number of edges (size of ground set); the dataset isn't sorted by size, so
+# a groupby would split (and overwrite) groups of graphs with the same size
 fb_dataset = load_facebook_dataset()
-networks = {
-    num_edges: list(graphs)
-    for num_edges, graphs in itt.groupby(fb_dataset, key=lambda g: len(g.edges))
-}
+networks: tp.Dict[int, tp.List[nx.Graph]] = {}
+for graph in fb_dataset:
+    networks.setdefault(graph.number_of_edges(), []).append(graph)
 
 
 def input_generator(
     size: int, uniform_weights: bool, number_of_deletions: int
 ) -> tp.Iterator[InputData]:
+    rng = spawn_rng()
     for graph in itt.cycle(networks[size]):
-        graph = copy.deepcopy(graph)
+        matroid = GraphicalMatroid(graph)
         if not uniform_weights:
-            set_weights(graph, {e: random.random() for e in graph.edges})
+            # copy so as not to modify the cached dataset graphs (no need otherwise,
+            # since the timers work on their own clones)
+            matroid = matroid.clone()
+            weights = rng.random(len(graph.edges)).tolist()
+            set_weights(matroid.graph, dict(zip(graph.edges, weights)))
 
-        matroid = GraphicalMatroid(graph)
         elements = list(matroid.ground_set)
 
         # reuse same matroid for 5 instances
         for _ in range(5):
-            random.shuffle(elements)
+            indices = rng.permutation(len(elements))[:number_of_deletions]
             yield {
                 "matroid": matroid,
-                "removal_sequence": elements[:number_of_deletions],
+                "removal_sequence": [elements[i] for i in indices],
             }
 
 
@@ -64,15 +69,16 @@ def time_partial_dynamic(
 ) -> float:
     """Time one run of the given dynamic algorithm; return time in seconds."""
     # make copy of shared matroid (because it's mutable)
-    matroid = copy.deepcopy(matroid)
+    matroid = matroid.clone()
 
     # start generator (only want to time dynamic part)
     remover = algorithm(matroid)
     remover.send(None)
 
+    # bind the method beforehand so that only the algorithm itself is timed
+    remove = remover.send
     with Stopwatch() as stopwatch:
-        for element in removal_sequence:
-            remover.send(element)
+        consume(map(remove, removal_sequence))
 
     return stopwatch.measurement
 
@@ -84,12 +90,13 @@ def time_full_dynamic(
 ):
     """Time one run of the given dynamic algorithm; return time in seconds."""
     # make copy of shared matroid (because it's mutable)
-    matroid = copy.deepcopy(matroid)
+    matroid = matroid.clone()
     algorithm_instance = algorithm(matroid)
 
+    # bind the method beforehand so that only the algorithm itself is timed
+    remove = algorithm_instance.remove_element
     with Stopwatch() as stopwatch:
-        for element in removal_sequence:
-            algorithm_instance.remove_element(element)
+        consume(map(remove, removal_sequence))
 
     return stopwatch.measurement
 
@@ -4,6 +4,8 @@
 import itertools as itt
 import typing as tp
 
+import networkx as nx
+
 from matroids.algorithms.static import maximal_independent_set
 from matroids.matroid import GraphicalMatroid
 from utils.performance_experiment import (
@@ -20,12 +22,12 @@ set_seed(2022)
 
 
 # download a graph dataset from the Stanford Large Network Dataset Collection
-# index by number of edges (size of ground set)
+# index by number of edges (size of ground set); the dataset isn't sorted by size, so
+# a groupby would split (and overwrite) groups of graphs with the same size
 fb_dataset = load_facebook_dataset()
-networks = {
-    num_edges: list(graphs)
-    for num_edges, graphs in itt.groupby(fb_dataset, key=lambda g: len(g.edges))
-}
+networks: tp.Dict[int, tp.List[nx.Graph]] = {}
+for graph in fb_dataset:
+    networks.setdefault(graph.number_of_edges(), []).append(graph)
 
 
 def input_generator(size: int) -> tp.Iterator[InputData]:
@@ -69,10 +69,16 @@ def download(url: str, path=None) -> pathlib.Path:
         filename = extract_filename(url)
         path = pathlib.Path.cwd().joinpath(filename)
 
+    # download to a temporary file and only move it into place once complete, so
+    # that an interrupted download doesn't leave a truncated file behind (which
+    # ensure_downloaded would then take for the complete one)
+    path = pathlib.Path(path)
+    partial_path = path.with_name(path.name + ".part")
     with DownloadTqdm(url) as progressbar:  # all optional kwargs
         urllib.request.urlretrieve(
-            url, filename=path, reporthook=progressbar.update_to, data=None
+            url, filename=partial_path, reporthook=progressbar.update_to, data=None
         )
+    partial_path.replace(path)
     return path
 
 
@@ -1,4 +1,4 @@
-import random
+import typing as tp
 
 import networkx as nx
 import numpy as np
@@ -7,15 +7,16 @@ from matroids.matroid import (
     GraphicalMatroid,
     MutableIntUniformMatroid,
     RealLinearMatroid,
-    set_weights,
 )
-from utils.misc import compute_missing_edges
+from utils.seed import spawn_rng
 
 
 def generate_random_dummy_matroid(
     size: int, rank: int, *, uniform_weights: bool
 ) -> MutableIntUniformMatroid:
-    weights = {} if uniform_weights else {i: random.random() for i in range(size)}
+    weights = {}
+    if not uniform_weights:
+        weights = dict(enumerate(spawn_rng().random(size).tolist()))
     return MutableIntUniformMatroid(size, rank, weights)
 
 
@@ -28,28 +29,73 @@ def generate_random_graphical_matroid(
     if size > (num_vertices * (num_vertices - 1) / 2):
         raise ValueError(f"Can't generate graph of size {size} with rank {rank}")
     graph: nx.Graph = nx.random_tree(n=num_vertices)
+    rng = spawn_rng()
 
     # add random cycles until we reach the desired size
     num_missing_edges = size - len(graph.edges)
-    missing_edges = compute_missing_edges(graph)
-    edges_to_add = random.sample(missing_edges, k=num_missing_edges)
-    graph.add_edges_from(edges_to_add)
+    cycle_edges = _sample_missing_edges(graph, num_missing_edges, rng)
 
-    # add weights
-    if not uniform_weights:
-        weights = {edge: random.random() for edge in graph.edges}
-        set_weights(graph, weights)
+    if uniform_weights:
+        graph.add_edges_from(cycle_edges)
+    else:
+        # draw all the weights at once and attach them while inserting the edges
+        # (the tree's edges are already there, so they just get their weight set)
+        edges = [*graph.edges, *cycle_edges]
+        weights = rng.random(len(edges)).tolist()
+        graph.add_weighted_edges_from((u, v, w) for (u, v), w in zip(edges, weights))
 
     return GraphicalMatroid(graph)
 
 
+def _sample_missing_edges(
+    graph: nx.Graph, count: int, rng: np.random.Generator
+) -> tp.List[tp.Tuple[tp.Any, tp.Any]]:
+    """
+    Sample edges that aren't in the graph uniformly at random, without replacement.
+
+    Rather than enumerating all of the O(|V|^2) missing edges, this draws
+    ``count + |E|`` distinct pairs of nodes (encoded as integers) and discards the
+    ones that are already edges of the graph, which leaves at least ``count`` pairs.
+
+    :param graph: Graph object.
+    :param count: Number of missing edges to sample.
+    :param rng: Random number generator.
+    :return: A list of ``count`` missing edges, as ``(u, v)`` pairs of nodes.
+    """
+    nodes = list(graph.nodes)
+    node_index = {node: i for i, node in enumerate(nodes)}
+
+    endpoints = np.fromiter(
+        (node_index[node] for edge in graph.edges for node in edge),
+        dtype=np.int64,
+        count=2 * graph.number_of_edges(),
+    ).reshape(-1, 2)
+    # the pair {i, j} with i < j is encoded as j * (j - 1) / 2 + i
+    i, j = endpoints.min(axis=1), endpoints.max(axis=1)
+    existing = j * (j - 1) // 2 + i
+
+    num_pairs = len(nodes) * (len(nodes) - 1) // 2
+    num_draws = min(num_pairs, count + len(existing))
+    codes = rng.choice(num_pairs, size=num_draws, replace=False)
+    codes = codes[~np.isin(codes, existing)][:count]
+
+    # decode (correcting for any rounding error in the square root)
+    j = np.floor((1 + np.sqrt(1 + 8 * codes.astype(float))) / 2).astype(np.int64)
+    j -= j * (j - 1) // 2 > codes
+    j += (j + 1) * j // 2 <= codes
+    i = codes - j * (j - 1) // 2
+    return [(nodes[u], nodes[v]) for u, v in zip(i.tolist(), j.tolist())]
+
+
 def generate_2_by_n_matrix_matroid(size: int) -> RealLinearMatroid:
-    matrix = np.random.random((2, size))
-    weights = np.random.random((size,))
+    rng = spawn_rng()
+    matrix = rng.random((2, size))
+    weights = rng.random(size)
     return RealLinearMatroid(matrix, weights)
 
 
 def generate_n_by_n_matrix_matroid(size: int) -> RealLinearMatroid:
-    matrix = np.random.random((size, size))
-    weights = np.random.random((size,))
+    rng = spawn_rng()
+    matrix = rng.random((size, size))
+    weights = rng.random(size)
     return RealLinearMatroid(matrix, weights)
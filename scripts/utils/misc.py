@@ -1,11 +1,11 @@
+import collections
 import itertools
 import os
 import pathlib
 import typing as tp
 
 import networkx as nx
-
-from matroids.matroid import EdgeType
+import numpy as np
 
 
 ROOT_OUTPUT_PATH = pathlib.Path(__file__).parent.parent.parent.resolve() / "artifacts"
@@ -13,20 +13,39 @@ ROOT_OUTPUT_PATH = pathlib.Path(__file__).parent.parent.parent.resolve() / "arti
 
 def compute_missing_edges(
     graph: nx.Graph, extra_nodes: tp.Set[tp.Any] = None
-) -> tp.Set[EdgeType]:
+) -> np.ndarray:
     """
-    Compute the set of edges that can be added to the graph.
+    Compute the edges that can be added to the graph.
 
     :param graph: Graph object.
     :param extra_nodes: Extra nodes outside of the graph from which to consider edges.
         Default is none.
 
-    :return: A set of missing edges.
+    :return: An object array of shape (m, 2) whose rows are the m missing edges (as
+        pairs of nodes).
     """
     extra_nodes = extra_nodes if extra_nodes is not None else set()
-    all_edges = set(itertools.combinations(graph.nodes | extra_nodes, r=2))  # O(|V|^2)
-    missing_edges = all_edges - set(graph.edges)
-    return missing_edges
+    nodes = list(graph.nodes | extra_nodes)
+    node_index = {node: i for i, node in enumerate(nodes)}
+
+    # adjacency matrix, in terms of the indices of the nodes in ``nodes``
+    is_edge = np.zeros((len(nodes), len(nodes)), dtype=bool)
+    endpoints = np.fromiter(
+        map(node_index.__getitem__, itertools.chain.from_iterable(graph.edges)),
+        dtype=np.intp,
+        count=2 * len(graph.edges),
+    )
+    sources, targets = endpoints[0::2], endpoints[1::2]
+    is_edge[sources, targets] = is_edge[targets, sources] = True
+
+    # candidate edges are the pairs of distinct nodes: O(|V|^2)
+    flat_indices = np.flatnonzero(np.triu(~is_edge, k=1))
+    missing_edges = np.stack(np.divmod(flat_indices, len(nodes)), axis=1)
+    # fill an object array element-wise so that NumPy keeps the labels as they are
+    # (``np.array(nodes)`` would unpack tuple labels and coerce mixed types)
+    labels = np.empty(len(nodes), dtype=object)
+    labels[:] = nodes
+    return labels[missing_edges]
 
 
 def ensure_directory_exists(
@@ -36,3 +55,8 @@ def ensure_directory_exists(
     path = pathlib.Path(path)
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def consume(iterator: tp.Iterator[tp.Any]) -> None:
+    """Exhaust an iterator, discarding its items (the loop runs in C)."""
+    collections.deque(iterator, maxlen=0)
@@ -1,8 +1,6 @@
 import dataclasses
-import functools
 import itertools as itt
 import logging
-import operator
 import sys
 import typing as tp
 
@@ -29,6 +27,17 @@ matplotlib.style.use(MATPLOTLIB_STYLE)
 
 PLOT_KINDS = ("mean&std", "mean&range")
 
+# built-in matplotlib backends that only render to files (``plt.show`` is a no-op)
+try:
+    NON_INTERACTIVE_BACKENDS = {name.lower() for name in mpl.rcsetup.non_interactive_bk}
+except AttributeError:
+    # removed in matplotlib 3.9 in favour of the backend registry
+    from matplotlib.backends import BackendFilter, backend_registry
+
+    NON_INTERACTIVE_BACKENDS = set(
+        backend_registry.list_builtin(BackendFilter.NON_INTERACTIVE)
+    )
+
 
 InputData = tp.Dict[str, tp.Any]  # keyword arguments
 PerformanceMeasurements = tp.Dict[str, np.ndarray]
@@ -68,6 +77,10 @@ class PerformanceExperiment:
         the input value).
     - repeats: Number of measurement repetitions per procedure, x value and input data.
         (This is to account for external factors which might affect the execution time.)
+    - warmup: Whether to run each procedure once (on the first input, for each x
+        value) before the actual measurements, discarding the result. This keeps
+        one-off costs such as lazy imports, cold caches or memoized setup out of the
+        first measurement.
 
     - title: Title of the experiment (optional).
     """
@@ -82,6 +95,7 @@ class PerformanceExperiment:
     ] = lambda **variables: itt.repeat(variables)
     generated_inputs: int = 1
     repeats: int = 10
+    warmup: bool = True
 
     title: tp.Optional[str] = None
 
@@ -93,13 +107,18 @@ class PerformanceExperiment:
             execution times as floats and indexed by
             (x value index, input data index, repetition).
         """
-        results = {
-            label: np.full(
-                (len(self.x_range), self.generated_inputs, self.repeats),
-                fill_value=np.nan,
-            )
-            for label in self.timer_functions
-        }
+        # a single buffer for all of the procedures (so that they can be summarised
+        # together), handed out as one view per label
+        buffer = np.full(
+            (
+                len(self.timer_functions),
+                len(self.x_range),
+                self.generated_inputs,
+                self.repeats,
+            ),
+            fill_value=np.nan,
+        )
+        results = dict(zip(self.timer_functions, buffer))
 
         if self.title is not None:
             print(self.title, file=sys.stderr)
@@ -115,12 +134,9 @@ class PerformanceExperiment:
                 desc="algorithms",
                 leave=False,
             ):
-                times = results[label]
-                for j, input_data in enumerate(
-                    tqdm.tqdm(inputs, desc="generated inputs", leave=False)
-                ):
-                    for k in tqdm.trange(self.repeats, desc="repeats", leave=False):
-                        times[i, j, k] = timer(**input_data)
+                results[label][i] = _measure_runs(
+                    timer, inputs, self.repeats, self.warmup
+                )
 
         return results
 
@@ -158,14 +174,16 @@ class PerformanceExperiment:
         ax.set_xlabel(self.x_name)
         ax.set_ylabel("time (s)")
 
-        all_means = []
-        for label, times in measurements.items():
-            min_times_among_repetitions = np.min(times, axis=-1)
-            means = min_times_among_repetitions.mean(axis=-1)
-            all_means.append(means)
+        # summarise all of the procedures at once, on an array indexed by
+        # (procedure, x value index, input data index, repetition)
+        all_min_times = np.min(np.stack(list(measurements.values())), axis=-1)
+        all_means = all_min_times.mean(axis=-1)
+        all_stds = all_min_times.std(axis=-1)
 
+        for label, min_times_among_repetitions, means, stds in zip(
+            measurements, all_min_times, all_means, all_stds
+        ):
             if plot_kind == "mean&std":
-                stds = min_times_among_repetitions.std(axis=-1)
                 ax.errorbar(self.x_range, means, yerr=stds, marker=".", label=label)
             elif plot_kind == "mean&range":
                 plot_mean_and_range(
@@ -178,7 +196,7 @@ class PerformanceExperiment:
             else:
                 assert False
 
-        ax.set_ylim(bottom=0, top=1.05 * max(np.max(a) for a in all_means))
+        ax.set_ylim(bottom=0, top=1.05 * np.max(all_means))
         ax.ticklabel_format(axis="y", scilimits=(-2, 2))
 
         ax.xaxis.set_major_formatter(mpl.ticker.EngFormatter())
@@ -192,6 +210,34 @@ class PerformanceExperiment:
         self.plot_performance(ax, self.measure_performance())
 
 
+def _measure_runs(
+    timer: tp.Callable[..., float],
+    inputs: tp.List[InputData],
+    repeats: int,
+    warmup: bool,
+) -> np.ndarray:
+    """
+    Measure the given timer ``repeats`` times on each of the given inputs.
+
+    If ``warmup`` is true, the timer is first run once on the first input, without
+    recording the result.
+
+    :return: A 2-axis array of execution times indexed by (input index, repetition).
+    """
+    if warmup and inputs:
+        timer(**inputs[0])
+
+    times = np.full((len(inputs), repeats), fill_value=np.nan)
+    # flat view of the measurements, i.e. indexed by (input, repetition) in row-major
+    flat_times = times.reshape(-1)
+    runs = itt.product(inputs, range(repeats))
+    for n, (input_data, _) in enumerate(
+        tqdm.tqdm(runs, total=len(flat_times), desc="runs", leave=False)
+    ):
+        flat_times[n] = timer(**input_data)
+    return times
+
+
 @dataclasses.dataclass
 class PerformanceExperimentGroup:
     identifier: str
@@ -231,11 +277,10 @@ class PerformanceExperimentGroup:
             experiment.plot_performance(ax, measurement, plot_kind=plot_kind)
 
         # legend - avoid duplicate labels
-        artist_dicts = [
-            dict(zip(labels, handles))
-            for handles, labels in map(plt.Axes.get_legend_handles_labels, axes.flat)
-        ]
-        artist_dict = functools.reduce(operator.or_, artist_dicts)  # dict union
+        artist_dict = {}
+        for ax in axes.flat:
+            handles, labels = ax.get_legend_handles_labels()
+            artist_dict.update(zip(labels, handles))
         fig.legend(artist_dict.values(), artist_dict.keys(), **legend_kwargs)
 
         fig.tight_layout()
@@ -266,10 +311,16 @@ class PerformanceExperimentGroup:
         plt.close(fig)
 
     def measure_show_and_save(self, **kwargs) -> None:
-        """Shortcut for running the experiments and showing the plot in one step."""
+        """
+        Shortcut for running the experiments and showing the plot in one step.
+
+        The figure is also saved to a file. If the current matplotlib backend can't
+        show figures, it's only saved (without building the figure to show).
+        """
         measurements = self.measure_performance()
         legend_kwargs = kwargs.pop("legend_kwargs", None)
-        self.show_performance(measurements, **kwargs)
+        if plt.get_backend().lower() not in NON_INTERACTIVE_BACKENDS:
+            self.show_performance(measurements, **kwargs)
         self.save_performance_figure(
             measurements, legend_kwargs=legend_kwargs, **kwargs
         )
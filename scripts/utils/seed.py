@@ -11,3 +11,14 @@ def set_seed(seed: int):
     random.seed(seed)
     np.random.seed(seed)
     logger.info(f"Random seed set to {seed}")
+
+
+def spawn_rng() -> np.random.Generator:
+    """
+    Create a local random generator seeded from the global NumPy random state.
+
+    This way, random draws can be made from a local generator (without going
+    through the global state on each draw) while remaining reproducible under
+    :func:`set_seed`.
+    """
+    return np.random.default_rng(np.random.randint(2**32, dtype=np.uint64))
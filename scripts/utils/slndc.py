@@ -11,19 +11,28 @@ References:
     [Last accessed: 2022-03-26].
 """
 
+import functools
 import pathlib
+import pickle
 import tarfile
 import typing as tp
 
 import networkx as nx
+import numpy as np
 
 from utils.download import ensure_downloaded
 
 
+@functools.lru_cache(maxsize=None)
 def load_facebook_dataset() -> tp.List[nx.Graph]:
     """
     Download and load the Facebook dataset from the SLNDC.
 
+    The parsed graphs are cached in a pickle file next to the downloaded archive, so
+    subsequent runs only need to unpickle them. The cache is rebuilt if the archive
+    is newer than it. Within a process, the result is memoized: the same list is
+    returned by every call, so callers shouldn't mutate it or its graphs.
+
     :returns: a list of networkx graph objects from the Facebook dataset.
     """
 
@@ -31,13 +40,29 @@ def load_facebook_dataset() -> tp.List[nx.Graph]:
         "https://snap.stanford.edu/data/facebook.tar.gz",
         path=pathlib.Path.cwd().joinpath("downloads").joinpath("facebook.tar.gz"),
     )
-    tar = tarfile.open(path)
-    filenames = [name for name in tar.getnames() if name.endswith("edges")]
+    cache_path = path.with_name("facebook.pickle")
+    if cache_path.is_file() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+        with open(cache_path, "rb") as file:
+            return pickle.load(file)
+
+    networks = _load_edge_lists(path)
+    with open(cache_path, "wb") as file:
+        pickle.dump(networks, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return networks
+
+
+def _load_edge_lists(path: pathlib.Path) -> tp.List[nx.Graph]:
+    """Parse each of the ``*.edges`` files in the given tar archive into a graph."""
     networks = []
-    for name in filenames:
-        with tar.extractfile(name) as file:
-            edges = [tuple(map(int, line.split())) for line in file.readlines()]
-            network = nx.from_edgelist(edges)
-            networks.append(network)
+    with tarfile.open(path) as tar:
+        # iterate over the members themselves (extracting by name looks each one up
+        # again in the archive's member list)
+        members = [m for m in tar.getmembers() if m.name.endswith("edges")]
+        for member in members:
+            with tar.extractfile(member) as file:
+                # parse with NumPy's tokenizer rather than int() on each token
+                edges = np.loadtxt(file, dtype=np.int64, ndmin=2)
+            # (rows as [u, v] lists are valid edges for networkx)
+            networks.append(nx.from_edgelist(edges.tolist()))
 
     return networks
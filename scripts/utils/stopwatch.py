@@ -16,20 +16,33 @@ class Stopwatch(tp.ContextManager["Stopwatch"]):
     """
 
     def __init__(self):
-        self.start_time = self.end_time = None
+        # integer nanoseconds, so that short intervals don't lose precision when
+        # subtracting two large float timestamps
+        self.start_time_ns = self.end_time_ns = None
 
     @property
     def measurement(self) -> float:
-        if self.end_time is None:
+        """The measured time in seconds."""
+        if self.end_time_ns is None:
             raise ValueError("No measurement has been performed yet")
-        return self.end_time - self.start_time
+        return (self.end_time_ns - self.start_time_ns) * 1e-9
+
+    @property
+    def start_time(self) -> tp.Optional[float]:
+        """The start timestamp in (fractional) seconds, as from ``perf_counter``."""
+        return None if self.start_time_ns is None else self.start_time_ns * 1e-9
+
+    @property
+    def end_time(self) -> tp.Optional[float]:
+        """The end timestamp in (fractional) seconds, as from ``perf_counter``."""
+        return None if self.end_time_ns is None else self.end_time_ns * 1e-9
 
     def __enter__(self):
-        self.start_time = time.perf_counter()
+        self.start_time_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.perf_counter()
+        self.end_time_ns = time.perf_counter_ns()
 
 
 def make_timer(func: tp.Callable) -> tp.Callable[..., float]:
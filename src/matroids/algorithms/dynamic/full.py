@@ -1,6 +1,7 @@
 """Algorithms for dynamic MIS that handle both addition and removal of elements."""
 
 import abc
+import itertools as itt
 import math
 import typing as tp
 
@@ -73,13 +74,36 @@ class DynamicMaximalIndependentSetComputer(metaclass=abc.ABCMeta):
         """
         pass
 
+    def remove_elements(self, elements: tp.Iterable[T], /) -> tp.FrozenSet[T]:
+        """
+        Remove several elements and return the resulting maximal independent set.
+
+        Equivalent to calling :meth:`remove_element` on each of the given elements
+        (but only the final solution is returned). Subclasses can override this to
+        amortize the work over the whole batch.
+
+        :param elements: Elements to remove (without duplicates).
+        :return: The new maximal independent set after removing all the elements.
+        :raises: KeyError if some element is not in the matroid.
+        """
+        result = self.current
+        for element in elements:
+            result = self.remove_element(element)
+        return result
+
 
 # type alias
 DynamicMaximalIndependentSetAlgorithm = tp.Type[DynamicMaximalIndependentSetComputer]
 
 
 class RestartGreedy(DynamicMaximalIndependentSetComputer):
-    """The baseline approach: rerun the greedy algorithm after each update."""
+    """
+    The baseline approach: rerun the greedy algorithm after each update.
+
+    Deliberately doesn't reuse anything from previous updates (no memoization of
+    previous results), as it serves as the reference point for the actual dynamic
+    algorithms in the benchmarks.
+    """
 
     def __init__(self, matroid: MutableMatroid[T]):
         super().__init__(matroid)
@@ -101,15 +125,24 @@ class RestartGreedy(DynamicMaximalIndependentSetComputer):
         self._current = result = maximal_independent_set(self._matroid)
         return result
 
+    def remove_elements(self, elements: tp.Iterable[T], /) -> tp.Set[T]:
+        # only need to rerun the greedy algorithm once for the whole batch
+        self._matroid.remove_elements(elements)
+        self._current = result = maximal_independent_set(self._matroid)
+        return result
+
 
 class NaiveDynamic(DynamicMaximalIndependentSetComputer):
     def __init__(self, matroid: MutableMatroid[T]):
         super().__init__(matroid)
 
         # linked list of elements with non-negative weight in descending order of weight
-        elements = filter(lambda x: matroid.get_weight(x) >= 0, matroid.ground_set)
-        elements = sorted(elements, key=matroid.get_weight, reverse=True)
-        self._elements: LinkedListSet[T] = LinkedListSet(elements)
+        self._elements: LinkedListSet[T] = LinkedListSet(matroid.elements_by_weight())
+        # weights of the elements in the list above, to avoid querying the matroid
+        # while walking the list
+        self._weights: tp.Dict[T, float] = {
+            x: matroid.get_weight(x) for x in self._elements
+        }
 
         # use greedy for initial solution
         independence_checker = matroid.stateful_independence_checker(set())
@@ -143,23 +176,44 @@ class NaiveDynamic(DynamicMaximalIndependentSetComputer):
             # new element with negative weight; solution doesn't change
             return self._current_solution
 
-        # insert element in sorted position; meanwhile reconstruct independent set
-        independence_checker, element_node = self._reconstruct_greedy(
-            until=lambda e: get_weight(e) <= weight
-        )
-        element_node = self._elements.insert(position=element_node, value=new_element)
+        # single pass over the list: replay the greedy algorithm up to the sorted
+        # position of the new element, insert it there, and then carry on from there
+        weights = self._weights
+        previous_solution = self._current_solution
+        independence_checker = self._matroid.stateful_independence_checker(set())
+        elements = self._elements.iter_values()
+        for element in elements:
+            if weights[element] <= weight:
+                position = self._elements.find(element)
+                elements = itt.chain((element,), elements)
+                break
+            if element in previous_solution:
+                independence_checker.add_element(element)
+        else:
+            position = None  # insert at the end
+        self._elements.insert(position=position, value=new_element)
+        weights[new_element] = weight
 
         # possible shortcut
         if not independence_checker.would_be_independent_after_adding(new_element):
             return self._current_solution
         else:
             independence_checker.add_element(new_element)
-            # already dealt with new_element as a special case; continue with the next
-            return self._continue_greedy(
-                independence_checker,
-                elements_start=element_node.next,
-                size_bound=len(self._current_solution) + 1,
-            )
+
+        # elements after the new one that weren't in the solution are still spanned by
+        # the pivots preceding them, so instead of continuing the greedy algorithm
+        # only the later pivots need to be checked again: the first one that no longer
+        # fits (if any) is displaced by the new element, and the rest all stay
+        solution = previous_solution | {new_element}
+        for element in elements:
+            if element not in previous_solution:
+                continue
+            if not independence_checker.add_if_independent(element):
+                solution -= {element}
+                break
+
+        self._current_solution = solution
+        return solution
 
     def remove_element(self, element_to_remove, /) -> tp.FrozenSet[T]:
         self._matroid.remove_element(element_to_remove)
@@ -167,14 +221,19 @@ class NaiveDynamic(DynamicMaximalIndependentSetComputer):
         # shortcut if element is not a pivot
         if element_to_remove not in self._current_solution:
             self._elements.discard(element_to_remove)
+            self._weights.pop(element_to_remove, None)
             return self._current_solution
 
-        # find sorted position of deleted element; meanwhile reconstruct independent set
-        independence_checker, element_node = self._reconstruct_greedy(
-            until=lambda e: e == element_to_remove
+        # no element before the removed one can join the solution: each of those not
+        # in it is spanned by the pivots preceding it, which are all still there;
+        # hence resume the greedy algorithm right after the removed element, from the
+        # previous solution minus the removed element (instead of replaying it)
+        element_node = self._elements.find(element_to_remove).next
+        independence_checker = self._matroid.stateful_independence_checker(
+            set(self._current_solution - {element_to_remove})
         )
-        element_node = element_node.next
         self._elements.remove(element_to_remove)
+        del self._weights[element_to_remove]
 
         return self._continue_greedy(
             independence_checker,
@@ -182,38 +241,6 @@ class NaiveDynamic(DynamicMaximalIndependentSetComputer):
             size_bound=len(self._current_solution),
         )
 
-    def _reconstruct_greedy(
-        self, until: tp.Callable[[T], bool]
-    ) -> tp.Tuple[MutableMatroid.StatefulIndependenceChecker, llist.dllistnode]:
-        """
-        Reconstruct the state of the greedy algorithm up to a certain point.
-
-        :param until: Reconstruct until this predicate becomes true for the
-            current element.
-
-        :returns: The independence checker object and the list position as they were in
-            the greedy algorithm at the step in which ``until_predicate`` becomes true.
-        """
-        previous_solution = self._current_solution
-
-        independent_set: tp.Set[T] = set()
-        checker = self._matroid.stateful_independence_checker(independent_set)
-
-        # (this search is linear, but it doesn't matter since we need to re-run
-        # part of the greedy algorithm afterwards, which is also linear)
-        for element_node in self._elements.iter_nodes():
-            element = element_node.value
-            if until(element):
-                break
-
-            if element in previous_solution:
-                checker.add_element(element)
-        else:
-            # in case there are no elements or position is the end of the list
-            element_node, indicator_node = None, None
-
-        return checker, element_node
-
     def _continue_greedy(
         self,
         independence_checker: MutableMatroid.StatefulIndependenceChecker,
@@ -223,8 +250,11 @@ class NaiveDynamic(DynamicMaximalIndependentSetComputer):
         """Run the greedy algorithm from the given element onwards."""
         independent_set = independence_checker.independent_subset
         for element in self._elements.iter_values(start=elements_start):
-            if independence_checker.would_be_independent_after_adding(element):
-                independence_checker.add_element(element)
+            # (the checker may have been seeded with later elements, which must not
+            # be checked again)
+            if element in independent_set:
+                continue
+            if independence_checker.add_if_independent(element):
                 if len(independent_set) >= size_bound:
                     break
 
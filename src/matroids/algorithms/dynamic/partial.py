@@ -4,8 +4,8 @@ import random
 import typing as tp
 
 from matroids.matroid import MutableMatroid, T
-from matroids.utils import RandomAccessMutableSet
-from ..static import maximal_independent_set_uniform_weights
+from matroids.utils import LinkedListSet, RandomAccessMutableSet
+from ..static import maximal_independent_set, maximal_independent_set_uniform_weights
 
 
 # type alias for (partial) dynamic maximal independent set algorithms:
@@ -41,6 +41,45 @@ def dynamic_addition_maximal_independent_set_uniform_weights(
         independence_checker.add_if_independent(new_element)
 
 
+def dynamic_removal_maximal_independent_set(
+    matroid: MutableMatroid[T],
+) -> tp.Generator[tp.Set, T, None]:
+    """
+    Compute the M.I.S. after each removal of an element.
+
+    If B is the current M.I.S. and the removed element e is in B, the new M.I.S. is
+    B - e + f, where f is the element of greatest (non-negative) weight not in B such
+    that B - e + f is independent, if there is any. Hence, instead of starting over,
+    the greedy algorithm is resumed from B - e, and it stops as soon as it finds f.
+
+    :param matroid: Weighted matroid of which to compute the maximal independent set.
+    :return: A generator that accepts elements to remove and yields the maximal
+        independent set after removing the given element from the matroid.
+    """
+    # linked list of elements with non-negative weight in descending order of weight
+    elements: LinkedListSet[T] = LinkedListSet(matroid.elements_by_weight())
+    current_set = maximal_independent_set(matroid)
+
+    while True:
+        element_to_remove = yield current_set
+        matroid.remove_element(element_to_remove)
+        elements.discard(element_to_remove)
+
+        # the M.I.S. remains the same if the removed element is not in it
+        if element_to_remove not in current_set:
+            continue
+
+        # resume the greedy algorithm from the previous M.I.S. minus the removed
+        # element; at most one element can be added to it
+        current_set = current_set - {element_to_remove}
+        independence_checker = matroid.stateful_independence_checker(current_set)
+        for element in elements:
+            if element in current_set:
+                continue
+            if independence_checker.add_if_independent(element):
+                break
+
+
 def dynamic_removal_maximal_independent_set_uniform_weights(
     matroid: MutableMatroid[T],
 ) -> tp.Generator[tp.Set, T, None]:
@@ -59,11 +98,15 @@ def dynamic_removal_maximal_independent_set_uniform_weights(
     # set of available elements at ith step; starts with independent singletons
     witness_sets: tp.List[RandomAccessMutableSet[T]] = [
         RandomAccessMutableSet(
-            x for x in matroid.ground_set if matroid.is_independent({x})
+            matroid.stateful_independence_checker(set()).independent_extensions(
+                matroid.ground_set
+            )
         )
     ]
     # elements selected for the maximal independent set
     pivots: tp.List[T] = []
+    # greedy algorithm step at which each pivot was selected
+    pivot_steps: tp.Dict[T, int] = {}
 
     step = 0  # greedy algorithm step (index of witness set / pivot to choose)
     while not matroid.is_empty:
@@ -72,6 +115,8 @@ def dynamic_removal_maximal_independent_set_uniform_weights(
         available_elements = witness_sets[step]
 
         # recover greedy algorithm set just before adding the deleted element
+        for pivot in pivots[step:]:
+            del pivot_steps[pivot]
         del pivots[step:]
         current_set = set(pivots)
 
@@ -82,15 +127,14 @@ def dynamic_removal_maximal_independent_set_uniform_weights(
             pivot = random.choice(available_elements)
             available_elements.discard(pivot)
             independence_checker.add_element(pivot)
+            pivot_steps[pivot] = step
             pivots.append(pivot)
 
             # advance onto the following step
             step += 1
             # update available elements
             available_elements = RandomAccessMutableSet(
-                x
-                for x in available_elements
-                if independence_checker.would_be_independent_after_adding(x)
+                independence_checker.independent_extensions(available_elements)
             )
             # store as next witness set
             witness_sets.append(available_elements)
@@ -108,7 +152,7 @@ def dynamic_removal_maximal_independent_set_uniform_weights(
             still_valid = element_to_remove not in current_set
 
         # removing a pivot; find out algorithm step and start over
-        step = pivots.index(element_to_remove)  # noqa
+        step = pivot_steps[element_to_remove]  # noqa
 
     # matroid is empty; yield empty set (MIS) as the final yield, also as a sentinel
     yield set()
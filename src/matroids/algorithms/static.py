@@ -1,8 +1,19 @@
 """The greedy algorithm for finding the maximal independent set of a matroid"""
 
+import functools
+import itertools as itt
 import typing as tp
 
-from matroids.matroid import Matroid, T
+import numpy as np
+
+from matroids.matroid import (
+    GraphicalMatroid,
+    IntUniformMatroid,
+    Matroid,
+    RealLinearMatroid,
+    T,
+)
+from matroids.matroid.graphical import EdgeType
 
 
 def maximal_independent_set(matroid: Matroid[T]) -> tp.Set[T]:
@@ -12,12 +23,8 @@ def maximal_independent_set(matroid: Matroid[T]) -> tp.Set[T]:
     :param matroid: Weighted matroid of which to find the maximal independent set.
     :return: The maximal independent set of the given matroid.
     """
-    # discard elements with negative weight
-    elements = filter(lambda x: matroid.get_weight(x) >= 0, matroid.ground_set)
-    # sort elements by descending order of weight
-    elements = sorted(elements, key=matroid.get_weight, reverse=True)
-
-    return _greedy_core(matroid, elements)
+    # discard elements with negative weight and sort by descending order of weight
+    return _greedy_core(matroid, matroid.elements_by_weight())
 
 
 def maximal_independent_set_uniform_weights(matroid: Matroid[T]) -> tp.Set[T]:
@@ -35,6 +42,7 @@ def maximal_independent_set_uniform_weights(matroid: Matroid[T]) -> tp.Set[T]:
     return _greedy_core(matroid, matroid.ground_set)
 
 
+@functools.singledispatch
 def _greedy_core(matroid: Matroid[T], elements_iterable: tp.Iterable[T]) -> tp.Set[T]:
     """
     Core of the greedy algorithm for computing the maximal independent set.
@@ -56,3 +64,128 @@ def _greedy_core(matroid: Matroid[T], elements_iterable: tp.Iterable[T]) -> tp.S
 
     # the set is modified in-place by the ``independence_checker`` generator
     return current_set
+
+
+@_greedy_core.register
+def _greedy_core_uniform(
+    matroid: IntUniformMatroid, elements_iterable: tp.Iterable[int]
+) -> tp.Set[int]:
+    """
+    Specialization of :func:`_greedy_core` for uniform matroids.
+
+    Every set of at most ``rank`` elements is independent, so the greedy algorithm
+    just selects the first ``rank`` elements.
+    """
+    return set(itt.islice(elements_iterable, matroid.rank))
+
+
+@_greedy_core.register
+def _greedy_core_graphical(
+    matroid: GraphicalMatroid, elements_iterable: tp.Iterable[EdgeType]
+) -> tp.Set[EdgeType]:
+    """
+    Specialization of :func:`_greedy_core` for graphical matroids.
+
+    This is Kruskal's algorithm: an edge is selected iff its endpoints are in different
+    trees of the current forest. The nodes are numbered so that the disjoint-set
+    structure is a pair of plain lists (parent indices and tree sizes), inlined into
+    the loop (with path halving and union by size), which avoids the method call
+    overhead of the generic stateful checker.
+    The search stops once the forest is a spanning tree, since no further edge can be
+    added to it.
+    """
+    node_index = {node: i for i, node in enumerate(matroid.graph)}
+    parent = list(range(len(node_index)))
+    size = [1] * len(node_index)
+    max_size = len(node_index) - 1
+
+    current_set: tp.Set[EdgeType] = set()
+    for edge in elements_iterable:
+        u, v = edge
+        root_u = node_index[u]
+        while root_u != (parent_u := parent[root_u]):
+            parent[root_u] = root_u = parent[parent_u]
+        root_v = node_index[v]
+        while root_v != (parent_v := parent[root_v]):
+            parent[root_v] = root_v = parent[parent_v]
+
+        if root_u != root_v:
+            # merge the two trees, attaching the smaller one to the larger one
+            if size[root_u] > size[root_v]:
+                root_u, root_v = root_v, root_u
+            parent[root_u] = root_v
+            size[root_v] += size[root_u]
+            current_set.add(edge)
+            if len(current_set) == max_size:
+                break
+
+    return current_set
+
+
+@_greedy_core.register
+def _greedy_core_linear(
+    matroid: RealLinearMatroid, elements_iterable: tp.Iterable[int]
+) -> tp.Set[int]:
+    """
+    Specialization of :func:`_greedy_core` for linear matroids.
+
+    The greedy algorithm selects an element iff its column isn't in the span of the
+    columns of the elements selected before it. Like the matroid's own independence
+    tests, this works on the columns of the row-reduced matrix and compares against
+    the matroid's rank tolerance. Instead of testing one column at a
+    time, the columns are projected onto the current span in blocks (Gram-Schmidt with
+    reorthogonalization, as matrix-matrix products). The elements selected next are the
+    run of consecutive independent ones starting at the first element in the block with
+    a nonzero residual, found with a single QR factorization. The block size adapts to
+    how sparse the selected elements are, and the search stops as soon as the rank
+    reaches the dimension of the space.
+    """
+    elements = np.fromiter(elements_iterable, dtype=np.intp)
+    # same representation and criterion as the matroid's own independence tests
+    matrix, tolerance = matroid.row_reduced_matrix, matroid.rank_tolerance
+    num_rows = matrix.shape[0]
+
+    # orthonormal basis of the span of the current set, as in the stateful checker
+    basis = np.empty((num_rows, num_rows))
+    rank = 0
+
+    current_set: tp.Set[int] = set()
+    start, block_size = 0, 1  # current block of candidate elements
+    while start < len(elements) and rank < num_rows:
+        candidates = elements[start : start + block_size]
+        residuals = matrix[:, candidates]  # a copy (fancy indexing)
+        span = basis[:, :rank]
+        for _ in range(2):
+            residuals -= span @ (span.T @ residuals)
+        residual_norms = np.linalg.norm(residuals, axis=0)
+        nonzero = residual_norms > tolerance
+
+        if not nonzero.any():
+            # all dependent; skip the whole block and look further ahead next time
+            start += len(candidates)
+            block_size *= 2
+            continue
+
+        # From the first independent element on, an unpivoted QR of the residuals
+        # tells how far the run of consecutive independent elements extends: the
+        # diagonal of R stays nonzero until the first column in the span of the
+        # previous ones. The whole run is selected at once.
+        offset = int(np.argmax(nonzero))
+        tail = residuals[:, offset : offset + num_rows - rank]
+        if tail.shape[1] == 1 or not nonzero[offset + 1]:
+            run = 1
+            basis[:, rank] = tail[:, 0] / residual_norms[offset]
+        else:
+            q, r = np.linalg.qr(tail)
+            independent = np.abs(np.diagonal(r)) > tolerance
+            run = len(independent) if independent.all() else int(np.argmin(independent))
+            basis[:, rank : rank + run] = q[:, :run]
+        current_set.update(candidates[offset : offset + run].tolist())
+        rank += run
+        start += offset + run
+        if offset + run == len(candidates):
+            block_size *= 2  # the whole block was selected; look further ahead
+        else:
+            block_size = max(1, block_size // 2)
+
+    return current_set
@@ -1,7 +1,10 @@
 import abc
-
+import copy
+import math
 import typing as tp
 
+import numpy as np
+
 
 T = tp.TypeVar("T")
 
@@ -123,6 +126,19 @@ class Matroid(tp.Generic[T], metaclass=abc.ABCMeta):
             """
             self.independent_subset.add(element)
 
+        def independent_extensions(self, elements: tp.Iterable[T]) -> tp.List[T]:
+            """
+            Batch version of :meth:`would_be_independent_after_adding`.
+
+            Doesn't modify the current subset. Subclasses can override this to test
+            all of the given elements at once more efficiently than one by one.
+
+            :param elements: Elements to test.
+            :return: The list of the given elements, in the same order, that would
+                each (individually) keep the subset independent if added to it.
+            """
+            return [x for x in elements if self.would_be_independent_after_adding(x)]
+
         @tp.final
         def add_if_independent(self, element: T) -> bool:
             """
@@ -200,6 +216,27 @@ class Matroid(tp.Generic[T], metaclass=abc.ABCMeta):
         """
         return 1.0
 
+    def elements_by_weight(self) -> tp.Sequence[T]:
+        """
+        Return the elements with non-negative weight in descending order of weight.
+
+        This is the order in which the greedy algorithm considers the elements. Ties
+        are broken by the iteration order of the ground set.
+
+        The default implementation sorts the ground set using :meth:`get_weight` as
+        the key. Subclasses that store their weights in bulk can override this with
+        a more efficient implementation.
+
+        :return: A sequence of the elements with non-negative weight, sorted by
+            descending order of weight.
+        """
+        # look up each weight only once and sort them in bulk; a stable sort on the
+        # negated weights keeps ties in the iteration order of the ground set
+        elements = list(self.ground_set)
+        weights = np.fromiter(map(self.get_weight, elements), float, len(elements))
+        order = np.argsort(-weights, kind="stable")
+        return [elements[i] for i in order[weights[order] >= 0].tolist()]
+
     def total_weight(self, subset: tp.AbstractSet[T]) -> float:
         """
         Utility to compute the total weight of a subset of elements.
@@ -209,7 +246,8 @@ class Matroid(tp.Generic[T], metaclass=abc.ABCMeta):
             set of this matroid.
         :return: The sum of the weights of the elements in the given subset.
         """
-        return sum(map(self.get_weight, subset))
+        # exactly rounded, so the result doesn't depend on the iteration order
+        return math.fsum(map(self.get_weight, subset))
 
 
 class MutableMatroid(Matroid[T], metaclass=abc.ABCMeta):
@@ -244,3 +282,27 @@ class MutableMatroid(Matroid[T], metaclass=abc.ABCMeta):
         :raises KeyError: If ``element`` is not in the matroid.
         """
         pass
+
+    def remove_elements(self, elements: tp.Iterable[T]) -> None:
+        """
+        Remove several elements from the matroid.
+
+        Equivalent to calling :meth:`remove_element` on each of the given elements.
+        Subclasses can override this to remove them all at once more efficiently.
+
+        :param elements: Elements to be removed (without duplicates).
+        :raises KeyError: If some element is not in the matroid. The elements before
+            it might have been removed already.
+        """
+        for element in elements:
+            self.remove_element(element)
+
+    def clone(self) -> "MutableMatroid[T]":
+        """
+        Return an independent copy of this matroid.
+
+        Mutating the copy doesn't affect the original, and vice versa. The default
+        implementation is a deep copy; subclasses can override this with a cheaper
+        way of copying their state.
+        """
+        return copy.deepcopy(self)
@@ -1,4 +1,5 @@
 import dataclasses
+import itertools as itt
 import typing as tp
 
 from matroids.utils import generate_subsets
@@ -60,6 +61,13 @@ class ExplicitMatroid(MutableMatroid[tp.Any]):
     def is_independent(self, subset: tp.AbstractSet[tp.Any]) -> bool:
         return frozenset(subset) in self.independent_sets
 
+    def is_independent_incremental(
+        self, independent_subset: tp.AbstractSet[tp.Any], new_element: tp.Any
+    ) -> bool:
+        # build the frozenset directly instead of an intermediate ``subset | {x}``
+        subset = frozenset(itt.chain(independent_subset, (new_element,)))
+        return subset in self.independent_sets
+
     def get_weight(self, element: tp.Any) -> float:
         return self.weights[element]
 
@@ -1,7 +1,9 @@
 import dataclasses
+import pickle
 import typing as tp
 
 import networkx as nx
+import numpy as np
 
 from .base import MutableMatroid
 
@@ -45,38 +47,82 @@ class GraphicalMatroid(MutableMatroid[EdgeType]):
             super().__init__(matroid, independent_subset)
             self.matroid: "GraphicalMatroid"
 
-            # initialise a disjoint-set data structure
-            # for determining the connected component that a given node belongs to
-            initial_subgraph = self.matroid.graph.edge_subgraph(independent_subset)
-            node_to_connected_component = nx.utils.UnionFind(initial_subgraph.nodes)
-            connected_components = nx.algorithms.connected_components(initial_subgraph)
-            for component_nodes in connected_components:
-                node_to_connected_component.union(*component_nodes)
+            # initialise a disjoint-set forest over the nodes, for determining the
+            # connected component that a given node belongs to; nodes that aren't in
+            # the parent dict are the roots of their own singleton component
+            self._parent: tp.Dict[tp.Any, tp.Any] = {}
+            self._component_size: tp.Dict[tp.Any, int] = {}
+            for u, v in independent_subset:
+                self._union(u, v)
 
-            self.node_to_connected_component = node_to_connected_component
+            # cache of the last edge checked and the roots of its endpoints, since
+            # ``add_element`` is usually called right after
+            # ``would_be_independent_after_adding`` (and no merge happens in between)
+            self._last_element: tp.Optional[EdgeType] = None
+            self._last_roots: tp.Tuple[tp.Any, tp.Any] = (None, None)
 
         def would_be_independent_after_adding(self, element: EdgeType) -> bool:
             u, v = element
             # the subset remains independent iff adding the edge {u, v} doesn't add a
             # cycle, i.e. if {u, v} connects two different connected components.
             # but if the edge was already in the set, adding it won't change anything
-            same_components = (
-                self.node_to_connected_component[u]
-                == self.node_to_connected_component[v]
-            )
-            return not same_components or element in self.independent_subset
+            root_u, root_v = self._find(u), self._find(v)
+            self._last_element, self._last_roots = element, (root_u, root_v)
+            return root_u != root_v or element in self.independent_subset
 
         def add_element(self, element: EdgeType) -> None:
-            u, v = element
             super().add_element(element)
+            if element == self._last_element:
+                root_u, root_v = self._last_roots
+            else:
+                u, v = element
+                root_u, root_v = self._find(u), self._find(v)
+            self._last_element, self._last_roots = None, (None, None)
             # update the connected components info (merge the two components)
-            self.node_to_connected_component.union(u, v)
+            if root_u != root_v:
+                self._link(root_u, root_v)
+
+        def _find(self, node: tp.Any) -> tp.Any:
+            """Find the root of the node's component (with path halving)."""
+            parent = self._parent
+            while (node_parent := parent.get(node, node)) != node:
+                parent[node] = node = parent.get(node_parent, node_parent)
+            return node
+
+        def _union(self, u: tp.Any, v: tp.Any) -> None:
+            """Merge the components of two nodes (by size)."""
+            root_u, root_v = self._find(u), self._find(v)
+            if root_u != root_v:
+                self._link(root_u, root_v)
+
+        def _link(self, root_u: tp.Any, root_v: tp.Any) -> None:
+            """Merge the components with the given (distinct) roots (by size)."""
+            sizes = self._component_size
+            size_u, size_v = sizes.get(root_u, 1), sizes.get(root_v, 1)
+            if size_u < size_v:
+                root_u, root_v = root_v, root_u
+            self._parent[root_v] = root_u
+            sizes[root_u] = size_u + size_v
 
     def get_weight(self, element: EdgeType) -> float:
         weight = self.graph.get_edge_data(*element).get("weight", 1.0)
         assert isinstance(weight, float)
         return weight
 
+    def elements_by_weight(self) -> tp.List[EdgeType]:
+        # collect the edges and their weights in a single pass over the edge data view
+        # (in the same order as the ground set) and sort them with NumPy; the sort is
+        # stable to break ties in the same way as the default implementation
+        edges: tp.List[EdgeType] = []
+        weight_list: tp.List[float] = []
+        for u, v, weight in self.graph.edges(data="weight", default=1.0):
+            edges.append((u, v))
+            weight_list.append(weight)
+        weights = np.array(weight_list, dtype=float)
+        order = np.argsort(-weights, kind="stable")
+        order = order[weights[order] >= 0]
+        return [edges[i] for i in order.tolist()]
+
     def add_element(self, element: EdgeType, weight: tp.Optional[float] = None) -> None:
         self.graph.add_edge(*element)
         if weight is not None:
@@ -89,8 +135,24 @@ class GraphicalMatroid(MutableMatroid[EdgeType]):
             # element not in matroid
             raise KeyError(element) from None
 
+    def remove_elements(self, elements: tp.Iterable[EdgeType]) -> None:
+        elements = list(elements)
+        for element in elements:
+            if not self.graph.has_edge(*element):
+                raise KeyError(element)
+        self.graph.remove_edges_from(elements)
+
+    def clone(self) -> "GraphicalMatroid":
+        # a pickle round trip copies the graph's nested dicts in C, which is several
+        # times faster than deepcopy's per-object dispatch
+        return pickle.loads(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+
 
 def set_weights(graph: nx.Graph, weights: tp.Mapping[EdgeType, float]) -> None:
     """Utility to set weights on a graph in a way compatible with GraphicalMatroid."""
-    for edge, weight in weights.items():
-        graph.edges[edge]["weight"] = weight
+    # write straight into the edges' attribute dicts through the adjacency view (an
+    # undirected edge's dict is shared by both endpoints), skipping the per-element
+    # overhead of the edge view
+    adjacency = graph.adj
+    for (u, v), weight in weights.items():
+        adjacency[u][v]["weight"] = weight
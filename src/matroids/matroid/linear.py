@@ -3,10 +3,24 @@ import functools
 import typing as tp
 
 import numpy as np
+import scipy.linalg
 
 from .base import Matroid
 
 
+# maximum number of independence test results memoized by each linear matroid
+_INDEPENDENCE_CACHE_SIZE = 4096
+
+# relative tolerance for certifying independence from a Cholesky factor of the Gram
+# matrix (forming the Gram matrix squares the condition number, so only about half of
+# the significant digits are reliable)
+_CHOLESKY_RTOL = np.sqrt(np.finfo(float).eps)
+
+# LAPACK routines for QR and Cholesky decompositions of float64 matrices,
+# looked up only once
+_geqrf, _potrf = scipy.linalg.get_lapack_funcs(("geqrf", "potrf"), dtype=np.float64)
+
+
 @dataclasses.dataclass(eq=False)
 class RealLinearMatroid(Matroid[int]):
     """
@@ -19,7 +33,7 @@ class RealLinearMatroid(Matroid[int]):
 
     This implementation uses 0-based integer indices as the column indices (i.e. the
     elements of the ground set). The matrix is stored as a (read-only) property of
-    the object.
+    the object, as a Fortran-contiguous (column-major) array of 64-bit floats.
 
     Weights are stored as an n-dimensional real vector, where n is the number of
     columns.
@@ -34,7 +48,9 @@ class RealLinearMatroid(Matroid[int]):
             raise ValueError(
                 f"Given array is not a matrix: has {self.matrix.ndim} dimensions"
             )
-        matrix = matrix.astype(float)
+        # store in column-major order, so that columns (the elements) are contiguous
+        # and the sub-matrices passed on to LAPACK need no further conversion
+        matrix = matrix.astype(float, order="F")
 
         # validate and store weights
         weights_shape = (matrix.shape[1],)
@@ -52,32 +68,247 @@ class RealLinearMatroid(Matroid[int]):
         object.__setattr__(self, "matrix", matrix)
         object.__setattr__(self, "weights", weights)
 
-    @property
-    @functools.cache  # this matroid is not mutable so we can memoize
+    @functools.cached_property  # this matroid is not mutable so we can memoize
     def ground_set(self) -> tp.AbstractSet[int]:
         # return the indices of columns in the matrix
-        return set(range(self.matrix.shape[1]))
+        return frozenset(range(self.matrix.shape[1]))
 
     def __bool__(self):
         return bool(self.matrix.shape[1])
 
     def is_independent(self, subset: tp.AbstractSet[int]) -> bool:
-        # fetch the given columns and check whether the resulting matrix is full-rank
-        columns_subset = self.get_matrix(subset)
-        # shortcut if the number of vectors is greater than the dimension of R^n
-        if columns_subset.shape[1] > columns_subset.shape[0]:
+        reduced_matrix = self.row_reduced_matrix
+        num_columns = len(subset)
+        # shortcut if the number of vectors is greater than the rank of the matrix
+        if num_columns > reduced_matrix.shape[0]:
             return False
-        return np.linalg.matrix_rank(columns_subset) == columns_subset.shape[1]
+        if num_columns == 0:
+            return True
+        if num_columns == 1:
+            # a single vector is independent iff it is (numerically) nonzero
+            (element,) = subset
+            norm = np.linalg.norm(reduced_matrix[:, element])
+            return bool(norm > self.rank_tolerance)
+
+        # memoize the general case (this matroid is not mutable)
+        subset = frozenset(subset)
+        cache = self._independence_cache
+        result = cache.get(subset)
+        if result is None:
+            # fetch the given columns and check whether the resulting matrix is
+            # full-rank (the rank doesn't depend on the order of the columns); the
+            # matrix is tall after the shortcut above, which is the faster
+            # orientation for QR, and it is a fresh copy (fancy indexing) that can
+            # be overwritten
+            indices = np.fromiter(subset, dtype=np.intp, count=num_columns)
+            result = _has_full_column_rank(
+                reduced_matrix[:, indices], self.rank_tolerance
+            )
+            if len(cache) >= _INDEPENDENCE_CACHE_SIZE:
+                del cache[next(iter(cache))]  # evict the oldest entry
+            cache[subset] = result
+        return result
+
+    @functools.cached_property  # this matroid is not mutable so we can memoize
+    def rank_tolerance(self) -> float:
+        """
+        Threshold below which a vector is considered to be (numerically) zero.
+
+        Analogous to the tolerance used by ``np.linalg.matrix_rank``: the norm of the
+        matrix times ``max(m, n)`` times the machine epsilon, except that it takes the
+        Frobenius norm (an upper bound of the spectral norm that is much cheaper to
+        compute). All rank and independence decisions for this matroid (the rank
+        itself, :meth:`is_independent`, the stateful checker and the greedy algorithm)
+        compare against it, so that they agree with each other.
+        """
+        num_rows, num_columns = self.matrix.shape
+        norm = np.linalg.norm(self.matrix)
+        return float(norm * max(num_rows, num_columns) * np.finfo(float).eps)
+
+    @functools.cached_property
+    def _independence_cache(self) -> tp.Dict[tp.FrozenSet[int], bool]:
+        """Memoized results of :meth:`is_independent` (in insertion order)."""
+        return {}
+
+    @functools.cached_property  # this matroid is not mutable so we can memoize
+    def row_reduced_matrix(self) -> np.ndarray:
+        """
+        A matrix with the same independent sets of columns but only rank-many rows.
+
+        If AP = QR is a rank-revealing QR decomposition of the matrix A, a set of
+        columns of A is linearly independent iff the same columns of Q^T A = R P^T
+        are, and only the first rank(A) rows of the latter are nonzero.
+        """
+        r, pivots, rank = _rank_revealing_qr(self.matrix, self.rank_tolerance)
+        reduced_matrix = np.empty((rank, self.matrix.shape[1]), order="F")
+        reduced_matrix[:, pivots] = r[:rank]
+        return reduced_matrix
+
+    class StatefulIndependenceChecker(Matroid.StatefulIndependenceChecker):
+        def __init__(
+            self,
+            matroid: "RealLinearMatroid",
+            independent_subset: tp.MutableSet[int],
+        ):
+            super().__init__(matroid, independent_subset)
+            self.matroid: "RealLinearMatroid"
+
+            # orthonormal basis of the span of the current subset, stored in the first
+            # ``rank`` columns of a preallocated buffer; works on the columns of the
+            # row-reduced matrix, like :meth:`is_independent`, so the rank can't exceed
+            # that of the matroid (the number of rows)
+            num_rows = matroid.row_reduced_matrix.shape[0]
+            self._basis = np.empty((num_rows, num_rows))
+            self._rank = 0
+            for element in independent_subset:
+                self._extend_basis(self._residual(element))
+
+            # cache of the last computed residual, since ``add_element`` is usually
+            # called right after ``would_be_independent_after_adding``
+            self._last_element: tp.Optional[int] = None
+            self._last_residual: tp.Optional[np.ndarray] = None
+
+        def would_be_independent_after_adding(self, element: int) -> bool:
+            if element in self.independent_subset:
+                return True
+            if self._rank == len(self._basis):
+                return False  # the current subset already spans the whole space
+            vector = self.matroid.row_reduced_matrix[:, element]
+            residual = self._project_out(vector.copy())
+            self._last_element, self._last_residual = element, residual
+            return bool(np.linalg.norm(residual) > self.matroid.rank_tolerance)
+
+        def independent_extensions(self, elements: tp.Iterable[int]) -> tp.List[int]:
+            elements = list(elements)
+            if self._rank == len(self._basis):
+                return [e for e in elements if e in self.independent_subset]
+            # project all of the candidate columns at once
+            indices = np.fromiter(elements, dtype=np.intp, count=len(elements))
+            vectors = self.matroid.row_reduced_matrix[:, indices]
+            residuals = self._project_out(vectors.copy())
+            residual_norms = np.linalg.norm(residuals, axis=0)
+            independent = residual_norms > self.matroid.rank_tolerance
+            return [
+                element
+                for element, is_independent in zip(elements, independent)
+                if is_independent or element in self.independent_subset
+            ]
+
+        def add_element(self, element: int) -> None:
+            if element in self.independent_subset:
+                return
+            super().add_element(element)
+            if element == self._last_element:
+                residual = self._last_residual
+            else:
+                residual = self._residual(element)
+            self._last_element = self._last_residual = None
+            self._extend_basis(residual)
+
+        def _residual(self, element: int) -> np.ndarray:
+            """Component of the given column orthogonal to the current span."""
+            return self._project_out(self.matroid.row_reduced_matrix[:, element].copy())
+
+        def _project_out(self, vectors: np.ndarray) -> np.ndarray:
+            """
+            Subtract (in-place) the projection onto the current span.
+
+            :param vectors: A vector or a matrix of column vectors.
+            :return: The given array, now orthogonal to the current span.
+            """
+            basis = self._basis[:, : self._rank]
+            # Gram-Schmidt with one step of reorthogonalization for numerical stability
+            for _ in range(2):
+                vectors -= basis @ (basis.T @ vectors)
+            return vectors
+
+        def _extend_basis(self, residual: np.ndarray) -> None:
+            self._basis[:, self._rank] = residual / np.linalg.norm(residual)
+            self._rank += 1
 
     def get_weight(self, element: int) -> float:
         return self.weights[element]
 
-    def get_matrix(self, subset: tp.AbstractSet[int]) -> np.ndarray:
+    def elements_by_weight(self) -> np.ndarray:
+        # stable sort to break ties in the same way as the default implementation
+        order = np.argsort(-self.weights, kind="stable")
+        return order[self.weights[order] >= 0]
+
+    def get_matrix(
+        self, subset: tp.AbstractSet[int], *, preserve_order: bool = True
+    ) -> np.ndarray:
         """
         Return the sub-matrix corresponding to the given subset of elements (columns).
 
         :param subset: Subset of column indices of this matroid's matrix.
-        :return: The sub-matrix corresponding to the given subset,
-             preserving column order.
+        :param preserve_order: Whether the columns should appear in the same order as
+            in this matroid's matrix. Callers that don't care about the order (e.g.
+            rank computations) can pass ``False`` to skip sorting the indices.
+        :return: The sub-matrix corresponding to the given subset.
         """
-        return self.matrix[:, sorted(subset)]
+        indices = np.fromiter(subset, dtype=np.intp, count=len(subset))
+        if preserve_order:
+            indices.sort()
+        return self.matrix[:, indices]
+
+
+def _has_full_column_rank(matrix: np.ndarray, tolerance: float) -> bool:
+    """
+    Whether the columns of a (nonempty) matrix are linearly independent.
+
+    The columns are independent iff the diagonal of the R factor of a QR decomposition
+    has no zeros, so (unlike for computing the rank) there is no need for column
+    pivoting nor for computing the Q factor.
+
+    The given matrix is overwritten, so it should be a (Fortran-contiguous) copy.
+
+    :param matrix: Matrix whose columns to test.
+    :param tolerance: Threshold below which a diagonal entry of R counts as zero.
+    """
+    num_rows, num_columns = matrix.shape
+    if num_rows >= 4 * num_columns:
+        # for tall and skinny matrices, first try the Cholesky decomposition of the
+        # (much smaller) Gram matrix, which is cheaper; in exact arithmetic the
+        # diagonal of its factor is that of R, but it can only certify independence
+        # when the diagonal is well above the noise, otherwise fall back on QR
+        largest_norm = np.max(np.linalg.norm(matrix, axis=0))
+        gram = matrix.T @ matrix
+        cholesky, info = _potrf(gram, clean=False, overwrite_a=True)
+        threshold = max(_CHOLESKY_RTOL * largest_norm, tolerance)
+        if info == 0 and np.all(np.diag(cholesky) > threshold):
+            return True
+
+    # call LAPACK directly, skipping the overhead of the high-level wrappers
+    qr, _, _, info = _geqrf(matrix, overwrite_a=True)
+    if info < 0:
+        raise ValueError(f"illegal value in argument {-info} of internal geqrf")
+    # (the diagonal of R is the diagonal of the packed result)
+    return bool(np.all(np.abs(np.diag(qr)) > tolerance))
+
+
+def _rank_revealing_qr(
+    matrix: np.ndarray, tolerance: float
+) -> tp.Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Compute the R factor of a QR decomposition with column pivoting, and the rank.
+
+    :param matrix: Matrix to decompose.
+    :param tolerance: Threshold below which a diagonal entry of R counts as zero.
+    :return: A tuple ``(r, pivots, rank)``, where ``matrix[:, pivots] = q @ r`` for
+        some orthogonal ``q``, and ``rank`` is the numerical rank of ``matrix``.
+    """
+    num_rows, num_columns = matrix.shape
+    if matrix.size == 0:
+        return np.zeros(matrix.shape), np.arange(num_columns), 0
+
+    r, pivots = scipy.linalg.qr(
+        matrix,
+        mode="r",
+        pivoting=True,
+        check_finite=False,
+    )
+    # the magnitudes of the diagonal of R are non-increasing, so the rank is the number
+    # of them above the tolerance
+    diagonal = np.abs(np.diag(r))
+    rank = int(np.count_nonzero(diagonal > tolerance))
+    return r, pivots, rank
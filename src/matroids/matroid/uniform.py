@@ -1,7 +1,10 @@
 import dataclasses
 import functools
+import itertools as itt
 import typing as tp
 
+import numpy as np
+
 from .base import Matroid, MutableMatroid
 
 
@@ -28,17 +31,43 @@ class IntUniformMatroid(Matroid[int]):
         """Construct an free matroid (rank = size) of the given size."""
         return cls(size=size, rank=size)
 
-    @property
-    @functools.cache  # the ground set cannot be reassigned nor mutated, so we can cache
+    @functools.cached_property  # the ground set can't be mutated, so we can cache
     def ground_set(self) -> tp.AbstractSet[int]:
-        return set(range(self.size))
+        return frozenset(range(self.size))
 
     def is_independent(self, subset: tp.AbstractSet[int]) -> bool:
         return len(subset) <= self.rank
 
+    def is_independent_incremental(
+        self, independent_subset: tp.AbstractSet[int], new_element: int
+    ) -> bool:
+        # no need to build the union; the new element is not in the subset
+        return len(independent_subset) < self.rank
+
+    class StatefulIndependenceChecker(Matroid.StatefulIndependenceChecker):
+        def would_be_independent_after_adding(self, element: int) -> bool:
+            # an element already in the subset doesn't change its size
+            return (
+                len(self.independent_subset) < self.matroid.rank
+                or element in self.independent_subset
+            )
+
     def get_weight(self, element: int) -> float:
         return self.weights.get(element, 1.0)
 
+    def elements_by_weight(self) -> tp.List[int]:
+        # gather the weights into an array without calling Python code per element
+        # and sort them with NumPy (stably, to break ties like the default does)
+        elements = list(self.ground_set)
+        weights = np.fromiter(
+            map(self.weights.get, elements, itt.repeat(1.0)),
+            dtype=float,
+            count=len(elements),
+        )
+        order = np.argsort(-weights, kind="stable")
+        order = order[weights[order] >= 0]
+        return [elements[i] for i in order.tolist()]
+
 
 @dataclasses.dataclass(eq=False, repr=False)
 class MutableIntUniformMatroid(IntUniformMatroid, MutableMatroid[int]):
@@ -53,6 +82,21 @@ class MutableIntUniformMatroid(IntUniformMatroid, MutableMatroid[int]):
     def __post_init__(self):
         self._elements: tp.Set[int] = set(range(self.size))
 
+    def __deepcopy__(self, memo: tp.Dict[int, tp.Any]) -> "MutableIntUniformMatroid":
+        new = self.clone()
+        memo[id(self)] = new
+        return new
+
+    def clone(self) -> "MutableIntUniformMatroid":
+        # the mutable state is just a set of ints and a dict of floats, so copying
+        # these directly is enough and much faster than the generic deep copy;
+        # the instance dict is copied directly too, bypassing copy.copy's dispatch
+        new = object.__new__(type(self))
+        new.__dict__ = self.__dict__.copy()
+        new._elements = self._elements.copy()
+        new.weights = self.weights.copy()
+        return new
+
     @property
     def ground_set(self) -> tp.AbstractSet[int]:
         return self._elements
@@ -64,3 +108,6 @@ class MutableIntUniformMatroid(IntUniformMatroid, MutableMatroid[int]):
 
     def remove_element(self, element: int) -> None:
         self._elements.remove(element)
+        # drop any weight override so that the state stays proportional to the
+        # current ground set (and a re-added element gets the default weight)
+        self.weights.pop(element, None)
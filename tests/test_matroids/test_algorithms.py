@@ -20,6 +20,7 @@ from matroids.algorithms.dynamic.full import (
 )
 from matroids.algorithms.dynamic.partial import (
     PartialDynamicMaximalIndependentSetAlgorithm,
+    dynamic_removal_maximal_independent_set,
     dynamic_removal_maximal_independent_set_uniform_weights,
 )
 from matroids.algorithms.static import (
@@ -27,6 +28,7 @@ from matroids.algorithms.static import (
     maximal_independent_set_uniform_weights,
 )
 from matroids.matroid import (
+    ExplicitMatroid,
     GraphicalMatroid,
     IntUniformMatroid,
     MutableIntUniformMatroid,
@@ -39,7 +41,9 @@ from matroids.utils import RandomAccessMutableSet
 
 # ------------------------------------ test cases -------------------------------------
 
-DYNAMIC_REMOVAL_ALGORITHMS = []
+DYNAMIC_REMOVAL_ALGORITHMS = [
+    dynamic_removal_maximal_independent_set,
+]
 
 DYNAMIC_REMOVAL_UNIFORM_WEIGHTS_ALGORITHMS = [
     dynamic_removal_maximal_independent_set_uniform_weights,
@@ -104,6 +108,41 @@ def test_maximalIndependentSet_linearMatroidUniformWeights_correct():
     assert result == {1, 2}
 
 
+def test_maximalIndependentSet_randomLowRankLinearMatroid_correct():
+    rng = np.random.default_rng(seed=2022)
+    # 10 vectors in R^6 spanning a subspace of dimension 3
+    matrix = rng.random((6, 3)) @ rng.random((3, 10))
+    matroid = RealLinearMatroid(matrix, weights=rng.random(10))
+    result = maximal_independent_set(matroid)
+    assert len(result) == 3
+    assert matroid.is_independent(result)
+
+
+def test_maximalIndependentSet_nearlyDependentColumns_consistentWithIsIndependent():
+    # numerically independent (rank 2), but only barely
+    matrix = np.array([[1, 1], [0, 1e-9]])
+    matroid = RealLinearMatroid(matrix, weights=np.array([2, 1]))
+    assert matroid.is_independent({0, 1})
+    assert np.linalg.matrix_rank(matrix) == 2
+    assert maximal_independent_set(matroid) == {0, 1}
+    checker = matroid.stateful_independence_checker({0})
+    assert checker.would_be_independent_after_adding(1)
+
+
+@pytest_cases.parametrize_with_cases("matroid", cases=case_random_graphical)
+def test_maximalIndependentSet_randomGraph_isMaximumSpanningForest(
+    matroid: GraphicalMatroid,
+):
+    result = maximal_independent_set(matroid)
+    assert matroid.is_independent(result)
+    # maximum spanning forest of the subgraph of edges with non-negative weight
+    graph = matroid.graph.edge_subgraph(
+        edge for edge in matroid.ground_set if matroid.get_weight(edge) >= 0
+    )
+    forest = nx.maximum_spanning_tree(graph)
+    assert matroid.total_weight(result) == pytest.approx(forest.size(weight="weight"))
+
+
 def test_maximalIndependentSet_matroidWithNegativeWeights_negativeWeightsIgnored():
     # free matroid with three elements, one with negative weight
     matroid = IntUniformMatroid(size=3, rank=3, weights={0: 1.0, 1: 1.0, 2: -2.0})
@@ -152,6 +191,15 @@ def test_dynamicRemovalMaximalIndependentSet_uniformWeightsRandomGraph_correct(
     _test_dynamicRemovalMaximalIndependentSet(algorithm, matroid)
 
 
+@pytest.mark.parametrize("algorithm", DYNAMIC_REMOVAL_ALGORITHMS)
+@pytest_cases.parametrize_with_cases("matroid", cases=case_random_graphical)
+def test_dynamicRemovalMaximalIndependentSet_randomGraph_correct(
+    algorithm: PartialDynamicMaximalIndependentSetAlgorithm,
+    matroid: MutableMatroid,
+):
+    _test_dynamicRemovalMaximalIndependentSet(algorithm, matroid)
+
+
 @pytest.mark.parametrize("algorithm", FULL_DYNAMIC_ALGORITHMS)
 def test_fullDynamicMaximalIndependentSet_basicSequence1_correct(
     algorithm: DynamicMaximalIndependentSetAlgorithm,
@@ -270,6 +318,40 @@ def test_fullDynamicMaximalIndependentSet_randomGraph(
     _test_fullDynamicMaximalIndependentSet(algorithm, matroid)
 
 
+@pytest.mark.parametrize("algorithm", FULL_DYNAMIC_ALGORITHMS)
+@pytest_cases.parametrize_with_cases("matroid", cases=case_random_graphical)
+def test_fullDynamicMaximalIndependentSet_removeElements_correct(
+    algorithm: DynamicMaximalIndependentSetAlgorithm,
+    matroid: MutableMatroid,
+):
+    algorithm_instance = algorithm(matroid)
+    elements = sorted(matroid.ground_set)
+    to_remove = random.sample(elements, k=len(elements) // 2)
+    previous_ground_set = set(matroid.ground_set)
+    result_set = algorithm_instance.remove_elements(to_remove)
+    assert matroid.ground_set == previous_ground_set - set(to_remove)
+
+    reference_set = maximal_independent_set(matroid)
+    assert matroid.is_independent(result_set)
+    assert matroid.total_weight(result_set) == matroid.total_weight(reference_set)
+
+
+def test_naiveDynamic_removePivot_incrementalCheckPreconditionHolds():
+    class StrictExplicitMatroid(ExplicitMatroid):
+        def is_independent_incremental(self, independent_subset, new_element):
+            assert new_element not in independent_subset
+            return super().is_independent_incremental(independent_subset, new_element)
+
+    weights = {0: 4.0, 1: 3.0, 2: 2.0, 3: 1.0}
+    uniform = ExplicitMatroid.uniform(weights, rank=2, weights=weights)
+    matroid = StrictExplicitMatroid(
+        uniform.elements, uniform.independent_sets, uniform.weights
+    )
+    algorithm_instance = NaiveDynamic(matroid)
+    assert algorithm_instance.current == {0, 1}
+    assert algorithm_instance.remove_element(0) == {1, 2}
+
+
 def _test_dynamicRemovalMaximalIndependentSet(
     algorithm: PartialDynamicMaximalIndependentSetAlgorithm, matroid: MutableMatroid
 ):
@@ -2,11 +2,20 @@
 Tests for the :class:`matroids.matroid.Matroid` class hierarchy.
 """
 
+import copy
 import typing as tp
 
 import networkx
+import numpy as np
 
-from matroids.matroid import ExplicitMatroid, GraphicalMatroid, Matroid
+from matroids.matroid import (
+    ExplicitMatroid,
+    GraphicalMatroid,
+    Matroid,
+    MutableIntUniformMatroid,
+    RealLinearMatroid,
+    set_weights,
+)
 from matroids.utils import generate_subsets
 
 
@@ -39,6 +48,69 @@ def test_mutableMatroid_removeElement_removedCorrectly():
     assert 1 not in matroid.weights
 
 
+def test_mutableIntUniformMatroid_removeElement_weightDropped():
+    matroid = MutableIntUniformMatroid(size=3, rank=2, weights={1: 2.0})
+    matroid.remove_element(1)
+    assert matroid.ground_set == {0, 2}
+    assert 1 not in matroid.weights
+    matroid.add_element(1)
+    assert matroid.get_weight(1) == 1.0
+
+
+def test_mutableIntUniformMatroid_deepCopy_independentOfOriginal():
+    matroid = MutableIntUniformMatroid(size=3, rank=2, weights={0: 2.0})
+    matroid_copy = copy.deepcopy(matroid)
+    matroid_copy.remove_element(1)
+    matroid_copy.add_element(0, weight=-1.0)
+    assert matroid.ground_set == {0, 1, 2} and matroid.get_weight(0) == 2.0
+    assert matroid_copy.ground_set == {0, 2} and matroid_copy.get_weight(0) == -1.0
+
+
+def test_graphicalMatroid_clone_independentOfOriginal():
+    graph = networkx.cycle_graph(4)
+    graph.edges[0, 1]["weight"] = 2.0
+    matroid = GraphicalMatroid(graph)
+    matroid_clone = matroid.clone()
+    matroid_clone.remove_element((2, 3))
+    matroid_clone.add_element((0, 1), weight=-1.0)
+    assert set(matroid.ground_set) == {(0, 1), (1, 2), (2, 3), (0, 3)}
+    assert matroid.get_weight((0, 1)) == 2.0
+    assert set(matroid_clone.ground_set) == {(0, 1), (1, 2), (0, 3)}
+    assert matroid_clone.get_weight((0, 1)) == -1.0
+
+
+def test_graphicalMatroid_elementsByWeight_updatedAfterMutations():
+    graph = networkx.cycle_graph(4)
+    weights = {(0, 1): 1.0, (1, 2): 3.0, (2, 3): 2.0, (0, 3): -1.0}
+    set_weights(graph, weights)
+    matroid = GraphicalMatroid(graph)
+    assert matroid.elements_by_weight() == [(1, 2), (2, 3), (0, 1)]
+    matroid.remove_element((2, 1))  # reversed orientation
+    matroid.remove_elements([(0, 3), (0, 1)])
+    assert matroid.elements_by_weight() == [(2, 3)]
+    matroid.add_element((1, 3), weight=1.5)
+    assert matroid.elements_by_weight() == [(2, 3), (1, 3)]
+
+
+def test_graphicalMatroid_elementsByWeight_updatedAfterSetWeights():
+    graph = networkx.cycle_graph(3)
+    set_weights(graph, {(0, 1): 1.0, (1, 2): 2.0, (0, 2): 3.0})
+    matroid = GraphicalMatroid(graph)
+    assert matroid.elements_by_weight() == [(0, 2), (1, 2), (0, 1)]
+    set_weights(graph, {(0, 1): 5.0, (1, 2): 2.0, (0, 2): -1.0})
+    assert matroid.elements_by_weight() == [(0, 1), (1, 2)]
+
+
+def test_graphicalMatroid_checkerAddIfIndependent_rejectsCycles():
+    matroid = GraphicalMatroid(networkx.cycle_graph(4))
+    checker = matroid.stateful_independence_checker({(0, 1)})
+    assert checker.add_if_independent((1, 2))
+    assert checker.add_if_independent((0, 1))  # already in the subset
+    assert checker.add_if_independent((2, 3))
+    assert not checker.add_if_independent((0, 3))
+    assert checker.independent_subset == {(0, 1), (1, 2), (2, 3)}
+
+
 def test_graphicalMatroid_independentSets_correct():
     graph = networkx.cycle_graph(4)
     matroid = GraphicalMatroid(graph)
@@ -56,3 +128,51 @@ def test_graphicalMatroid_independentSets_correct():
             }
         )
     )
+
+
+def test_realLinearMatroid_independentSets_correct():
+    matrix = np.array(
+        [
+            [1, 2, 0, 1],
+            [0, 0, 1, 1],
+            [0, 0, 0, 0],
+        ]
+    )
+    matroid = RealLinearMatroid(matrix)
+    independent_sets = get_independent_sets(matroid)
+    # any set of at most two columns is independent unless it contains
+    # both of the (parallel) first two columns
+    assert independent_sets == frozenset(
+        subset
+        for subset in generate_subsets(matroid.ground_set, range(3))
+        if not {0, 1}.issubset(subset)
+    )
+
+
+def test_realLinearMatroid_independentExtensions_agreesWithSingleChecks():
+    rng = np.random.default_rng(seed=2022)
+    matrix = rng.random((4, 3)) @ rng.random((3, 10))
+    matroid = RealLinearMatroid(matrix)
+    # the first three columns already span the column space
+    checker = matroid.stateful_independence_checker({0, 1, 2})
+    expected = [
+        x for x in matroid.ground_set if checker.would_be_independent_after_adding(x)
+    ]
+    assert checker.independent_extensions(matroid.ground_set) == expected == [0, 1, 2]
+
+
+def test_realLinearMatroid_checkerAtFullRank_onlyCurrentElementsIndependent():
+    matroid = RealLinearMatroid(np.array([[1, 0, 1, 2], [0, 1, 1, 0]]))
+    checker = matroid.stateful_independence_checker({0, 1})
+    assert checker.would_be_independent_after_adding(1)
+    assert not checker.would_be_independent_after_adding(2)
+    assert checker.independent_extensions(matroid.ground_set) == [0, 1]
+
+
+def test_realLinearMatroid_checkerNearlyDependentColumns_agreesWithIsIndependent():
+    # numerically independent (rank 2), but only barely
+    matroid = RealLinearMatroid(np.array([[1, 1], [0, 1e-9]]))
+    checker = matroid.stateful_independence_checker({0})
+    assert matroid.is_independent({0, 1})
+    assert checker.would_be_independent_after_adding(1)
+    assert checker.independent_extensions([1]) == [1]